@@ -0,0 +1,797 @@
+"""
+Logger Module - Drug Intelligence Automation
+Centralized logging for all processing steps
+Writes a shared per-run log file with colored console output
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+from typing import Any, Dict, Optional
+
+
+class _LazyParams:
+    """
+    Defers the key=value join of a kwargs dict until a handler actually
+    formats the record, so filtered-out records never pay for the join
+    """
+
+    __slots__ = ('kwargs',)
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return ", ".join(f"{k}={v}" for k, v in self.kwargs.items())
+
+
+# Directories already created this process — os.makedirs costs a stat
+# per component even when everything exists
+_created_dirs = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process, skipping repeat syscalls"""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _stdout_supports_color() -> bool:
+    """Whether stdout is an interactive terminal that wants ANSI colors"""
+    try:
+        return sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+    except (AttributeError, ValueError):
+        return False
+
+
+# LogRecord construction normally captures thread, process and
+# multiprocessing context on every record; none of it appears in the
+# formats below, so switch the lookups off globally
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.Formatter.default_msec_format = None
+
+# No format here references %(filename)s / %(lineno)d / %(funcName)s,
+# yet Logger._log walks the stack via findCaller for every record to
+# fill them in; disabling _srcfile takes the documented fast path
+logging._srcfile = None
+
+# process_name is stamped onto records by the factory from a thread
+# local — no extra= dict allocation and no adapter merge per call.
+# Each thread logs under the id it set last via a facade instance.
+_tls = threading.local()
+_old_record_factory = logging.getLogRecordFactory()
+
+
+def _record_factory(*args, **kwargs):
+    record = _old_record_factory(*args, **kwargs)
+    record.process_name = getattr(_tls, 'process_name', 'INIT')
+    return record
+
+
+logging.setLogRecordFactory(_record_factory)
+
+# Formatters are shared across handlers and instances — each carries a
+# cached asctime state, so fresh ones per setup were wasted work
+_MAIN_FMT = logging.Formatter(
+    '%(asctime)s - [%(levelname)s] - Process: %(process_name)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_PLAIN_CONSOLE_FMT = logging.Formatter('[%(levelname)s] %(message)s')
+_SIMPLE_FMT = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+
+# Fixed per-process timestamp — gives the shared log file a
+# deterministic name and saves a strftime per logger setup
+_START_TS = time.strftime("%Y%m%d_%H%M%S")
+
+# Separator lines are constant — repeated str * int allocates a fresh
+# 80-char string per banner call
+_SEP_EQ_80 = "=" * 80
+_SEP_DASH_60 = "-" * 60
+
+SUCCESS_LEVEL = 25
+
+
+def _register_success_level() -> None:
+    """Register the custom SUCCESS level between INFO and WARNING
+
+    Runs once at import — re-registering per logger instance repeated
+    the addLevelName call and monkey-patch for every construction.
+    """
+    if getattr(logging.Logger, 'success', None) is not None:
+        return
+    logging.addLevelName(SUCCESS_LEVEL, "SUCCESS")
+
+    def success(self, message, *args, **kwargs):
+        if self.isEnabledFor(SUCCESS_LEVEL):
+            self._log(SUCCESS_LEVEL, message, args, **kwargs)
+
+    logging.Logger.success = success
+
+
+_register_success_level()
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks bytes written itself
+    The stock shouldRollover does a seek+tell on every emit; keeping a
+    running counter makes the common no-rollover case pure arithmetic
+    """
+
+    def _open(self):
+        try:
+            self._written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._written = 0
+        return super()._open()
+
+    def format(self, record):
+        # Cached so the size check and the actual emit share one
+        # formatting pass; only this handler reads the cache
+        cached = getattr(record, '_frfh_msg', None)
+        if cached is None:
+            cached = super().format(record)
+            record._frfh_msg = cached
+        return cached
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        size = len(self.format(record)) + 1
+        written = getattr(self, '_written', 0)
+        if written + size < self.maxBytes:
+            self._written = written + size
+            return False
+        # Near the threshold — let the stock check decide against the
+        # real file size (another writer may have rotated underneath us)
+        if super().shouldRollover(record):
+            return True
+        self._written = written + size
+        return False
+
+    def doRollover(self):
+        super().doRollover()
+        self._written = 0
+
+
+class FastFileHandler(logging.Handler):
+    """
+    Minimal append-only file handler over a raw descriptor
+    Skips FileHandler's TextIOWrapper encode/flush layers — each record
+    is a single os.write of the formatted line. Fits the standalone
+    setup_logger path where rotation and buffering are not needed.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0)
+        self._fd = os.open(path, flags, 0o644)
+
+    def emit(self, record):
+        try:
+            os.write(self._fd, (self.format(record) + "\n").encode('utf-8', 'replace'))
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        fd, self._fd = self._fd, -1
+        try:
+            if fd >= 0:
+                os.close(fd)
+        finally:
+            super().close()
+
+
+class ColoredFormatter(logging.Formatter):
+    """
+    Console formatter that colors the level name and message
+    Adds status icons for quick visual scanning
+    """
+
+    COLORS = {
+        'DEBUG':    '\033[90m',
+        'INFO':     '\033[97m',
+        'SUCCESS':  '\033[92m',
+        'WARNING':  '\033[93m',
+        'ERROR':    '\033[91m',
+        'CRITICAL': '\033[95m',
+        'RESET':    '\033[0m',
+    }
+
+    ICONS = {
+        'DEBUG':    '🔍',
+        'INFO':     'ℹ️',
+        'SUCCESS':  '✅',
+        'WARNING':  '⚠️',
+        'ERROR':    '❌',
+        'CRITICAL': '🔥',
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The colored "icon LEVEL" prefix is constant per level — build
+        # the table once instead of three f-string concats per record.
+        # When stdout is piped (or NO_COLOR is set) the escapes are pure
+        # byte bloat, so the tables degrade to plain text up front and
+        # format() stays branch-free either way.
+        use_color = _stdout_supports_color()
+        reset = self.COLORS['RESET'] if use_color else ''
+        self._prefix = {}
+        self._wrap = {}
+        for level, color in self.COLORS.items():
+            if level == 'RESET':
+                continue
+            if not use_color:
+                color = ''
+            self._prefix[level] = f"{color}{self.ICONS.get(level, '')} {level}{reset}"
+            self._wrap[level] = (color, reset)
+
+    def format(self, record):
+        levelname = record.levelname
+        record.levelname_colored = self._prefix.get(levelname, levelname)
+        color, reset = self._wrap.get(levelname, ('', ''))
+        record.msg_colored = f"{color}{record.getMessage()}{reset}"
+        return super().format(record)
+
+
+# ── Shared base logger ───────────────────────────────────────────────────
+# One logging.Logger, one handler chain and one log file per OS process.
+# Per-instance handler chains meant N DrugIntelligenceLogger objects
+# opened N descriptors and formatted every record N times; instances are
+# now facades that stamp their process id onto records via context.
+
+_base_lock = threading.Lock()
+_base_logger = None
+_base_buffered = None
+_base_listener = None
+_base_filepath = None
+_base_flush_stop = None
+
+# Numeric threshold mirrored from the shared base logger's level — hot
+# helpers reject a filtered record with one integer compare instead of
+# isEnabledFor. Module-level (not per facade) because the level itself
+# is shared: a set_level() through any facade must be seen by all.
+_eff_level = logging.DEBUG
+
+
+def _init_base_logger(log_dir: str, log_level: int) -> None:
+    """Build the shared handler chain — runs once, under _base_lock"""
+    global _base_logger, _base_buffered, _base_listener
+    global _base_filepath, _base_flush_stop, _eff_level
+
+    _base_filepath = os.path.join(log_dir, f"DrugIntelligence_{_START_TS}.log")
+
+    # delay=True defers the open() until the first record; the
+    # MemoryHandler batches ~1000 records per flush so normal INFO
+    # traffic costs one write per batch instead of one per line.
+    # ERROR and above still flush immediately for durability.
+    # Rotation caps runaway processes at 50MB x 6 files so a single
+    # run can never fill the Logs share.
+    file_handler = FastRotatingFileHandler(
+        _base_filepath, mode='a', maxBytes=50 * 1024 * 1024,
+        backupCount=5, encoding='utf-8', delay=True
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(_MAIN_FMT)
+    _base_buffered = MemoryHandler(
+        1000, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+    )
+    _base_buffered.setLevel(logging.DEBUG)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    if _stdout_supports_color():
+        console_handler.setFormatter(
+            ColoredFormatter('%(levelname_colored)s %(msg_colored)s'))
+    else:
+        console_handler.setFormatter(_PLAIN_CONSOLE_FMT)
+
+    logger = logging.getLogger("DrugIntelligence")
+    logger.setLevel(log_level)
+    _eff_level = log_level
+
+    # The logger itself carries only a QueueHandler, so callers return
+    # after a cheap enqueue; the background listener thread owns the
+    # real handlers and absorbs the disk and TTY latency.
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _base_listener = QueueListener(
+        log_queue, _base_buffered, console_handler,
+        respect_handler_level=True
+    )
+    _base_listener.start()
+    atexit.register(_shutdown_base_logger)
+
+    # The memory buffer only flushes at capacity or on ERROR; the
+    # timer bounds how stale the file can get during quiet periods
+    _base_flush_stop = threading.Event()
+    threading.Thread(
+        target=_flush_base_periodically, daemon=True,
+        name="DrugIntelligenceFlush"
+    ).start()
+
+    _base_logger = logger
+
+
+def _get_base_logger(log_dir: str, log_level: int) -> logging.Logger:
+    """Return the shared base logger, configuring it on first use"""
+    if _base_logger is None:
+        with _base_lock:
+            if _base_logger is None:
+                _init_base_logger(log_dir, log_level)
+    return _base_logger
+
+
+def _flush_base_periodically() -> None:
+    """Flush the buffered file handler once per second until shutdown"""
+    while not _base_flush_stop.wait(1.0):
+        _base_buffered.flush()
+
+
+def _shutdown_base_logger() -> None:
+    """Drain the queue, stop the listener and close all handlers"""
+    global _base_listener
+    if _base_flush_stop is not None:
+        _base_flush_stop.set()
+    if _base_listener is not None:
+        _base_listener.stop()
+        for handler in _base_listener.handlers:
+            handler.close()
+        _base_listener = None
+
+
+class DrugIntelligenceLogger:
+    """
+    Main logger class for Drug Intelligence Automation
+    A thin facade over the shared base logger that stamps each record
+    with its process id
+    """
+
+    SUCCESS_LEVEL = SUCCESS_LEVEL
+
+    def __init__(
+        self,
+        process_id: Optional[str] = None,
+        log_dir: str = "./Logs",
+        log_level: int = logging.DEBUG
+    ):
+        """
+        Initialize a facade over the shared base logger
+
+        Args:
+            process_id: Unique process identifier (default: timestamp)
+            log_dir: Directory for log files
+            log_level: Minimum level written to the log file
+        """
+        # Single clock read for the default process id, the filename
+        # timestamp and the Started-at banner line below
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        self.process_id = process_id or timestamp
+
+        self.log_dir = log_dir
+        try:
+            _ensure_dir(log_dir)
+        except OSError as e:
+            # Only the directory create gets a fallback — an unwritable
+            # share is survivable, broken handler setup is not
+            print(f"Warning: Could not create log directory: {e}")
+            self.log_dir = "."
+
+        self.logger = _get_base_logger(self.log_dir, log_level)
+        _tls.process_name = self.process_id
+        self.log_filepath = _base_filepath
+        self.log_filename = os.path.basename(_base_filepath)
+        self._bind_log_methods()
+
+        separator = _SEP_EQ_80
+        self.info(
+            f"{separator}\n"
+            f"Drug Intelligence Logger initialized - Process ID: {self.process_id}\n"
+            f"Started at: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{separator}"
+        )
+
+    def _bind_log_methods(self) -> None:
+        """Cache bound logger methods used on hot wrapper paths
+
+        Saves the per-call attribute resolution through self.logger for
+        wrappers invoked in tight loops (per-row query/file logging).
+        """
+        self._debug = self.logger.debug
+        self._info = self.logger.info
+        self._error = self.logger.error
+        self._dispatch = {
+            'DEBUG':    self.logger.debug,
+            'INFO':     self.logger.info,
+            'SUCCESS':  self.logger.success,
+            'WARNING':  self.logger.warning,
+            'ERROR':    self.logger.error,
+            'CRITICAL': self.logger.critical,
+        }
+    def set_level(self, level: int) -> None:
+        """
+        Change the minimum log level at runtime
+
+        Args:
+            level: New minimum level (e.g. logging.INFO)
+        """
+        global _eff_level
+        self.logger.setLevel(level)
+        _eff_level = level
+
+    def update_process_id(self, new_process_id: str) -> None:
+        """
+        Switch the process id carried on subsequent records
+
+        Handlers and the log file stay as built — the id only flows into
+        each record through the process_name context, so a rebuild
+        (close + reopen of the file) would be wasted syscalls. The id is
+        tracked per thread; worker threads set their own.
+
+        Args:
+            new_process_id: New process identifier
+        """
+        self.process_id = new_process_id
+        _tls.process_name = new_process_id
+
+    # ── Core level wrappers ──────────────────────────────────────────────
+
+    def _log_with_context(self, level: str, message: str, *args, **kwargs) -> None:
+        """Route a message through the underlying logger with process context
+
+        Positional args are forwarded for %-style interpolation so the
+        stdlib defers formatting until a handler accepts the record.
+        """
+        self._dispatch[level](message, *args, **kwargs)
+
+    def debug(self, message: str) -> None:
+        self._log_with_context('DEBUG', message)
+
+    def info(self, message: str) -> None:
+        self._log_with_context('INFO', message)
+
+    def success(self, message: str) -> None:
+        self._log_with_context('SUCCESS', message)
+
+    def warning(self, message: str) -> None:
+        self._log_with_context('WARNING', message)
+
+    def error(self, message: str) -> None:
+        self._log_with_context('ERROR', message)
+
+    def critical(self, message: str) -> None:
+        self._log_with_context('CRITICAL', message)
+
+    # ── Step / function helpers ──────────────────────────────────────────
+
+    def log_function_entry(self, func_name: str, **kwargs) -> None:
+        """
+        Log entry into a function with its parameters
+
+        Args:
+            func_name: Name of the function being entered
+            **kwargs: Function parameters to record
+        """
+        # Guard before building the record at all — entry tracing fires
+        # once per call in the processors, almost always with DEBUG off
+        if _eff_level > logging.DEBUG:
+            return
+        self._debug(
+            ">>> ENTERING: %s(%s)", func_name, _LazyParams(kwargs))
+
+    def log_function_exit(self, func_name: str, result: Any = None) -> None:
+        """
+        Log exit from a function with optional result
+
+        Args:
+            func_name: Name of the function being exited
+            result: Optional return value summary
+        """
+        if _eff_level > logging.DEBUG:
+            return
+        if result is not None:
+            self._debug(
+                "<<< EXITING: %s | Result: %s", func_name, result)
+        else:
+            self._debug(
+                "<<< EXITING: %s", func_name)
+
+    def log_function_start(self, function_name: str, **params) -> None:
+        """
+        Log the start of a major function with parameters
+
+        Args:
+            function_name: Name of the function
+            **params: Parameters to record
+        """
+        if _eff_level > logging.INFO:
+            return
+        self._info("🚀 Starting function: %s(%s)", function_name, _LazyParams(params))
+
+    def log_database_query(self, query: str, params: Any = None) -> None:
+        """
+        Log a database query with its parameters
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+        """
+        if _eff_level > logging.DEBUG:
+            return
+        self._debug(
+            "DB Query: %s | Params: %s", query, params)
+
+    def log_database_operation(self, operation: str, table: str, details: str = "") -> None:
+        """
+        Log a database operation on a table
+
+        Args:
+            operation: Operation type (SELECT/INSERT/UPDATE/...)
+            table: Target table name
+            details: Extra details
+        """
+        if _eff_level > logging.DEBUG:
+            return
+        self._log_with_context('DEBUG', "DB Operation: %s on table '%s' - %s",
+                               operation, table, details)
+
+    def log_file_operation(self, operation: str, filepath: str, status: str = "SUCCESS") -> None:
+        """
+        Log a file operation with its status
+
+        Args:
+            operation: Operation performed (READ/WRITE/COPY/...)
+            filepath: Path to the file
+            status: Operation status
+        """
+        self._info(
+            "📁 File %s: %s - %s", operation, filepath, status)
+
+    def log_excel_operation(self, operation: str, filepath: str, details: str = "") -> None:
+        """
+        Log an Excel file operation
+
+        Args:
+            operation: Operation performed
+            filepath: Path to the Excel file
+            details: Extra details
+        """
+        if _eff_level > logging.INFO:
+            return
+        # Called per worksheet write in export loops — skip the normpath
+        # machinery inside os.path.basename when there is no separator
+        filename = filepath.rsplit(os.sep, 1)[-1] if os.sep in filepath else filepath
+        self._info(
+            "📊 Excel %s: %s %s", operation, filename, details)
+
+    def log_email_status(self, recipient: str, subject: str, status: str) -> None:
+        """
+        Log an email send attempt
+
+        Args:
+            recipient: Recipient address list
+            subject: Email subject
+            status: Send status
+        """
+        self._info(
+            "📧 Email to %s | Subject: %s | Status: %s", recipient, subject, status)
+
+    def log_email_sent(self, recipient: str, subject: str, status: str = "SUCCESS") -> None:
+        """
+        Log a completed email send
+
+        Args:
+            recipient: Recipient address list
+            subject: Email subject
+            status: Send status
+        """
+        if _eff_level > logging.INFO:
+            return
+        self._log_with_context('INFO', "📧 Email sent to %s | Subject: %s | Status: %s",
+                               recipient, subject, status)
+
+    def log_customer_processing(self, customer_name: str, status: str = "STARTED") -> None:
+        """
+        Log customer-level processing progress
+
+        Args:
+            customer_name: Customer being processed
+            status: Processing status
+        """
+        if _eff_level > logging.INFO:
+            return
+        self._log_with_context('INFO', "🏢 Customer: %s - %s", customer_name, status)
+
+    def log_process_status(self, status: str, details: str = "") -> None:
+        """
+        Log overall process status
+
+        Args:
+            status: Current process status
+            details: Extra details
+        """
+        self._log_with_context('INFO', "📌 Process Status: %s %s", status, details)
+
+    def log_process_step(self, step_name: str, status: str = "STARTED") -> None:
+        """
+        Log a major process step with separators
+
+        Args:
+            step_name: Name of the step
+            status: Step status
+        """
+        separator = _SEP_EQ_80
+        self.info(f"{separator}\nSTEP: {step_name} - {status}\n{separator}")
+
+    def log_section(self, title: str) -> None:
+        """
+        Log a section header with separators
+
+        Args:
+            title: Section title
+        """
+        separator = _SEP_DASH_60
+        self.info(f"{separator}\n  {title}\n{separator}")
+
+    def log_process_start(self, process_name: str) -> None:
+        """
+        Log the start banner for a named process
+
+        Args:
+            process_name: Name of the process starting
+        """
+        separator = _SEP_EQ_80
+        self.info(
+            f"{separator}\n"
+            f"PROCESS STARTED: {process_name}\n"
+            f"Process ID: {self.process_id}\n"
+            f"{separator}"
+        )
+
+    def log_exception(self, func_name: str, exception: Exception) -> None:
+        """
+        Log an exception with full traceback at DEBUG level
+
+        Args:
+            func_name: Function where the exception occurred
+            exception: The exception instance
+        """
+        self._error(
+            "Exception in %s: %s: %s",
+            func_name, type(exception).__name__, exception)
+        # Traceback formatting walks every frame — only pay for it when
+        # a DEBUG handler will actually consume the record
+        if _eff_level <= logging.DEBUG:
+            self._debug(
+                f"Traceback:\n{traceback.format_exc()}")
+
+    def log_summary(self, summary_data: Dict[str, Any]) -> None:
+        """
+        Log the execution summary block
+
+        Args:
+            summary_data: Key/value pairs to include in the summary
+        """
+        # One record instead of len(summary_data)+4 — each record pays
+        # the full handler/format/lock pipeline on its own
+        separator = _SEP_EQ_80
+        lines = [separator, "EXECUTION SUMMARY", separator]
+        lines.extend(f"{key}: {value}" for key, value in summary_data.items())
+        lines.append(separator)
+        self.info("\n".join(lines))
+
+    def close(self) -> None:
+        """Log the closing banner and push buffered records to disk
+
+        The handler chain is shared with other instances, so closing a
+        facade only flushes; teardown happens once at interpreter exit.
+        """
+        separator = _SEP_EQ_80
+        self.info(
+            f"{separator}\n"
+            f"Process {self.process_id} completed\n"
+            f"Ended at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{separator}"
+        )
+
+        if _base_buffered is not None:
+            _base_buffered.flush()
+
+
+# ── Module-level singleton access ────────────────────────────────────────
+
+_logger_cache: Dict[str, DrugIntelligenceLogger] = {}
+
+
+def get_logger(process_id: Optional[str] = None) -> DrugIntelligenceLogger:
+    """
+    Get the logger for a process id, creating it on first use
+
+    Instances are cached per process id so alternating ids under worker
+    patterns reuse existing handlers instead of reopening log files.
+
+    Args:
+        process_id: Process identifier for the logger
+
+    Returns:
+        DrugIntelligenceLogger: Cached logger instance
+    """
+    key = process_id or "INIT"
+    instance = _logger_cache.get(key)
+    if instance is None:
+        instance = DrugIntelligenceLogger(process_id=process_id)
+        _logger_cache[key] = instance
+    else:
+        # A cache hit must still re-stamp the thread-local id: another
+        # facade fetched since may have left its own id in _tls, and
+        # records are tagged from _tls, not from the instance
+        _tls.process_name = instance.process_id
+    return instance
+
+
+# ── Plain module logger (used by standalone scripts) ─────────────────────
+
+def setup_logger(name: str, log_file: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Configure a plain file logger for standalone scripts
+
+    Args:
+        name: Logger name
+        log_file: Path to the log file
+        level: Minimum log level
+
+    Returns:
+        logging.Logger: Configured logger
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    if not logger.handlers:
+        handler = FastFileHandler(log_file)
+        handler.setFormatter(_SIMPLE_FMT)
+        # Same async pipeline as DrugIntelligenceLogger: callers enqueue,
+        # the listener thread takes the write latency
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+    return logger
+
+
+LOG_DIR = "./Logs"
+_default_logger = None
+
+
+def get_default_logger() -> logging.Logger:
+    """
+    Get the module default logger, creating it on first use
+
+    Importing this module no longer creates the Logs directory or opens
+    a file handle — tools that never log pay nothing.
+
+    Returns:
+        logging.Logger: Shared default logger
+    """
+    global _default_logger
+    if _default_logger is None:
+        # Ride the shared DrugIntelligence chain rather than opening a
+        # second descriptor and handler set for a parallel default file
+        _ensure_dir(LOG_DIR)
+        _default_logger = _get_base_logger(LOG_DIR, logging.INFO)
+    return _default_logger
@@ -0,0 +1,86 @@
+"""
+Health Check Dashboard Tasks - Drug Intelligence Automation
+Background jobs behind the dashboard: the 24-hour action trigger scan
+runs on a django-q schedule instead of inside the request path
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from django_q.models import Schedule
+from django_q.tasks import async_task
+
+from hc_models import ProcessStatus, invalidate_process_caches
+
+logger = logging.getLogger("hc.dashboard")
+
+
+def scan_and_trigger():
+    """
+    Queue the follow-up job for processes whose action window has been
+    open for 24 hours
+
+    Runs every minute on the django-q schedule. Rows that already fired
+    carry a triggered_at marker and are filtered out up front.
+    """
+    now = timezone.now()
+
+    # Dedup guard: with several qcluster workers two scans can overlap
+    # and queue the same follow-up twice before triggered_at lands.
+    # cache.add is atomic — whoever sets the key first runs the scan,
+    # everyone else returns on an O(1) cache probe.
+    if not cache.add("hc_trigger_scan_lock", now.isoformat(), timeout=55):
+        logger.debug("Trigger scan skipped — another scan holds the window")
+        return
+
+    # One indexed query: the denormalized action_required flag replaces
+    # the report-table EXISTS probes, and the readiness test runs in
+    # SQL so only rows whose 24-hour window has already lapsed come
+    # back. Streaming off the cursor keeps peak memory at one chunk.
+    ready_records = (
+        ProcessStatus.objects.using("health_check")
+        .filter(action_required=True,
+                EndTime__isnull=False,
+                EndTime__lte=now - timedelta(hours=24),
+                triggered_at__isnull=True)
+        .values("id", "JobId", "Customer", "Environment", "EndTime")
+        .iterator(chunk_size=500))
+
+    triggered_ids = []
+    triggered_job_ids = set()
+    detail_lines = []
+    log_detail = logger.isEnabledFor(logging.DEBUG)
+    for record in ready_records:
+        async_task("scheduler_app.tasks.run_action_followup", record["id"])
+        triggered_ids.append(record["id"])
+        triggered_job_ids.add(record["JobId"])
+        if log_detail:
+            # EndTime comes back aware-UTC (TIMESTAMPTZ + USE_TZ), so
+            # no per-row normalization is needed
+            detail_lines.append(
+                f"{record['id']}\t"
+                f"{record['Customer']}/{record['Environment']}\t"
+                f"{record['EndTime']}")
+
+    if triggered_ids:
+        # One UPDATE for the whole batch instead of a round-trip per row
+        ProcessStatus.objects.using("health_check").filter(
+            id__in=triggered_ids).update(triggered_at=now)
+        # Bulk .update() fires no signals — invalidate explicitly
+        for job_id in triggered_job_ids:
+            invalidate_process_caches(job_id)
+        logger.info(
+            "✅ Trigger scan queued %d follow-up job(s)", len(triggered_ids))
+        if detail_lines:
+            # One write, one handler-lock acquisition for the whole batch
+            logger.debug("⏳ Ready processes:\n%s", "\n".join(detail_lines))
+
+
+def ensure_schedule():
+    """Register the minute-level trigger scan if not scheduled yet"""
+    Schedule.objects.get_or_create(
+        func="hc_dashboard_tasks.scan_and_trigger",
+        defaults={"schedule_type": Schedule.CRON, "cron": "* * * * *"},
+    )
@@ -0,0 +1,184 @@
+"""
+Health Check Models - Drug Intelligence Automation
+ORM models for the health-check dashboard (reads the health_check database)
+"""
+
+from django.core.cache import cache
+from django.db import models
+
+# Action-flag conditions. Evaluated once at write time by the
+# any_action_yes generated columns below; query code filters on the
+# stored boolean instead of re-planning these ORs per call.
+DB_ACTION_Q = (
+    models.Q(connection_action__iexact="yes") |
+    models.Q(password_update_action__iexact="yes") |
+    models.Q(tablespace_action__iexact="yes") |
+    models.Q(backup_action__iexact="yes") |
+    models.Q(archive_log_action__iexact="yes") |
+    models.Q(sga_action__iexact="yes") |
+    models.Q(service_action__iexact="yes")
+)
+FS_ACTION_Q = (
+    models.Q(mount_action__iexact="yes") |
+    models.Q(disk_usage_action__iexact="yes") |
+    models.Q(inode_action__iexact="yes") |
+    models.Q(permission_action__iexact="yes") |
+    models.Q(growth_action__iexact="yes")
+)
+
+
+class ScheduledJob(models.Model):
+    """A configured health-check job shown on the dashboard"""
+
+    name = models.CharField(max_length=100)
+    enabled = models.BooleanField(default=True)
+    deployment_version = models.CharField(max_length=50, blank=True)
+    cron_expression = models.CharField(max_length=50, blank=True)
+    status = models.CharField(max_length=20, default="IDLE")
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    next_run_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        app_label = "scheduler_app"
+        db_table = "scheduled_job"
+
+    def __str__(self):
+        return self.name
+
+
+class ProcessStatus(models.Model):
+    """One row per health-check process execution"""
+
+    JobId = models.IntegerField(db_index=True)
+    Customer = models.CharField(max_length=100)
+    Environment = models.CharField(max_length=50)
+    Tenant = models.CharField(max_length=100, blank=True)
+    Status = models.CharField(max_length=20)
+    ErrorMessage = models.TextField(blank=True)
+    StartTime = models.DateTimeField(null=True, blank=True)
+    EndTime = models.DateTimeField(null=True, blank=True)
+    # Set once the 24-hour follow-up has been queued so the trigger
+    # scan never fires twice for the same process
+    triggered_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Denormalized OR of the report-table action flags, maintained when
+    # report rows are written — readers do one indexed boolean lookup
+    # instead of correlated EXISTS probes per row
+    action_required = models.BooleanField(default=False, db_index=True)
+
+    class Meta:
+        app_label = "scheduler_app"
+        db_table = "process_status"
+        ordering = ["-id"]
+
+    def __str__(self):
+        return f"{self.Customer}/{self.Environment} [{self.Status}]"
+
+
+def invalidate_process_caches(job_id):
+    """
+    Drop the cached total and bump the page-cache version for one job
+
+    The post_save/post_delete receivers call this, but so must every
+    queryset .update() write path directly — bulk updates fire no
+    signals.
+    """
+    cache.delete(f"ps_total_count:{job_id}")
+    # Bumping the version orphans every cached page body for this job
+    # without having to enumerate the keys
+    try:
+        cache.incr(f"procstat:ver:{job_id}")
+    except ValueError:
+        cache.set(f"procstat:ver:{job_id}", 1, None)
+
+
+def _flag_action_required(report):
+    """Propagate a report's action flags onto its ProcessStatus row"""
+    if any(getattr(report, f).strip().lower() == "yes"
+           for f in report._ACTION_FIELDS):
+        updated = ProcessStatus.objects.using(report._state.db).filter(
+            pk=report.status_id, action_required=False,
+        ).update(action_required=True)
+        if updated:
+            # .update() bypasses signals, so invalidate here; the flag
+            # changes what the dashboard renders for this job
+            job_id = (ProcessStatus.objects.using(report._state.db)
+                      .filter(pk=report.status_id)
+                      .values_list("JobId", flat=True).first())
+            invalidate_process_caches(job_id)
+
+
+class HcDatabaseReport(models.Model):
+    """Per-process database health findings with action flags"""
+
+    status = models.ForeignKey(
+        ProcessStatus, on_delete=models.CASCADE,
+        db_column="status_id", related_name="db_reports")
+    connection_action = models.CharField(max_length=10, blank=True)
+    password_update_action = models.CharField(max_length=10, blank=True)
+    tablespace_action = models.CharField(max_length=10, blank=True)
+    backup_action = models.CharField(max_length=10, blank=True)
+    archive_log_action = models.CharField(max_length=10, blank=True)
+    sga_action = models.CharField(max_length=10, blank=True)
+    service_action = models.CharField(max_length=10, blank=True)
+    # Stored generated column: the 7-way OR is computed by the DB on
+    # write, so reads collapse to an indexed boolean lookup
+    any_action_yes = models.GeneratedField(
+        expression=DB_ACTION_Q,
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
+
+    _ACTION_FIELDS = (
+        "connection_action", "password_update_action", "tablespace_action",
+        "backup_action", "archive_log_action", "sga_action",
+        "service_action",
+    )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _flag_action_required(self)
+
+    class Meta:
+        app_label = "scheduler_app"
+        db_table = "hc_database_report"
+        indexes = [
+            models.Index(fields=["status", "any_action_yes"],
+                         name="hc_db_any_action_idx",
+                         condition=models.Q(any_action_yes=True)),
+        ]
+
+
+class HcFilesystemReport(models.Model):
+    """Per-process filesystem health findings with action flags"""
+
+    status = models.ForeignKey(
+        ProcessStatus, on_delete=models.CASCADE,
+        db_column="status_id", related_name="fs_reports")
+    mount_action = models.CharField(max_length=10, blank=True)
+    disk_usage_action = models.CharField(max_length=10, blank=True)
+    inode_action = models.CharField(max_length=10, blank=True)
+    permission_action = models.CharField(max_length=10, blank=True)
+    growth_action = models.CharField(max_length=10, blank=True)
+    any_action_yes = models.GeneratedField(
+        expression=FS_ACTION_Q,
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
+
+    _ACTION_FIELDS = (
+        "mount_action", "disk_usage_action", "inode_action",
+        "permission_action", "growth_action",
+    )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _flag_action_required(self)
+
+    class Meta:
+        app_label = "scheduler_app"
+        db_table = "hc_filesystem_report"
+        indexes = [
+            models.Index(fields=["status", "any_action_yes"],
+                         name="hc_fs_any_action_idx",
+                         condition=models.Q(any_action_yes=True)),
+        ]
@@ -21,6 +21,7 @@ install_requires = [
 
     # ── Frontend ───────────────────────────────────────────────
     "django-bootstrap5>=25.3",
+    "Jinja2>=3.1",            # dashboard templates (jinja2_env.py)
 
     # ── Audit ──────────────────────────────────────────────────
     "django-easy-audit>=1.3",
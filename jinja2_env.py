@@ -0,0 +1,70 @@
+"""
+Jinja2 Environment - Health Check Dashboard
+Environment factory for the django.template.backends.jinja2.Jinja2 backend
+Wire up in settings with 'environment': 'jinja2_env.environment'
+"""
+
+import getpass
+import os
+import tempfile
+
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+
+from django_bootstrap5.templatetags.django_bootstrap5 import (
+    bootstrap_css,
+    bootstrap_javascript,
+)
+from jinja2 import Environment, FileSystemBytecodeCache
+
+
+def url(name, *args, **kwargs):
+    """Jinja-friendly replacement for the DTL {% url %} tag"""
+    return reverse(name, args=args or None, kwargs=kwargs or None)
+
+
+def _bytecode_cache():
+    """
+    Compiled-template cache shared across processes and restarts
+
+    The directory must not be a fixed world-writable path — on a shared
+    host another user could pre-create it and plant bytecode this
+    process would execute. Pin it via JINJA_BYTECODE_CACHE_DIR in
+    settings; the default is a per-user 0700 directory, and a directory
+    owned by anyone else is refused in favour of a fresh private one.
+    """
+    cache_dir = getattr(settings, "JINJA_BYTECODE_CACHE_DIR", None)
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            tempfile.gettempdir(), f"jinja_cache_{getpass.getuser()}")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if hasattr(os, "geteuid") and os.stat(cache_dir).st_uid != os.geteuid():
+        cache_dir = tempfile.mkdtemp(prefix="jinja_cache_")
+    return FileSystemBytecodeCache(cache_dir)
+
+
+def environment(**options):
+    """
+    Build the shared Jinja2 environment for dashboard templates
+
+    Templates are compiled once and kept forever (cache_size=-1,
+    auto_reload=False) so repeated renders skip the lexer/parser/codegen.
+
+    Returns:
+        Environment: Configured Jinja2 environment
+    """
+    options.setdefault("auto_reload", False)
+    options.setdefault("cache_size", -1)
+    options.setdefault("bytecode_cache", _bytecode_cache())
+    env = Environment(**options)
+    env.globals.update({
+        "static": static,
+        "url": url,
+        # Rendered once here: the tag output depends only on settings,
+        # so templates interpolate a fixed string instead of calling
+        # into django-bootstrap5 on every render
+        "bootstrap_css": bootstrap_css(),
+        "bootstrap_javascript": bootstrap_javascript(),
+    })
+    return env
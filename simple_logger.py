@@ -0,0 +1,234 @@
+"""
+Simple Logger Module - Drug Intelligence Automation
+Lightweight console + file logger for standalone scripts
+Writes a main log, an error log and a debug log per run
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Optional
+
+# Timestamp strings only change once per second — cache the formatted
+# value so N log calls in the same second pay for one strftime
+_last_sec = 0
+_last_str = ''
+
+
+def _timestamp() -> str:
+    """Return the current 'YYYY-MM-DD HH:MM:SS' string, cached per second"""
+    global _last_sec, _last_str
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_str
+
+
+# Directories already created this process — skip the stat in makedirs
+# when a second Logger reuses the same location
+_created_dirs = set()
+
+# Common separator lines, built once instead of a str * int per call
+_SEP_CACHE = {
+    ("=", 80): "=" * 80,
+    ("-", 60): "-" * 60,
+    ("-", 80): "-" * 80,
+}
+
+
+class Logger:
+    """
+    Plain logger without the stdlib logging machinery
+    Prints colored messages and appends to per-run log files
+    """
+
+    COLORS = {
+        'DEBUG':   '\033[90m',
+        'INFO':    '\033[97m',
+        'WARNING': '\033[93m',
+        'ERROR':   '\033[91m',
+        'RESET':   '\033[0m',
+    }
+
+    # (prefix, suffix) console byte pairs per level — reused across
+    # calls so the writer never re-encodes ANSI escapes or branches on
+    # level beyond one dict lookup
+    _COLOR_BY_LEVEL = {
+        'DEBUG':   (b'\x1b[90m', b'\x1b[0m\n'),
+        'INFO':    (b'\x1b[97m', b'\x1b[0m\n'),
+        'WARNING': (b'\x1b[93m', b'\x1b[0m\n'),
+        'ERROR':   (b'\x1b[91m', b'\x1b[0m\n'),
+    }
+    _PLAIN_WRAP = (b'', b'\n')
+
+    def __init__(self, log_dir: str = "./Logs"):
+        """
+        Initialize logger and open the log files for this run
+
+        Args:
+            log_dir: Directory for log files
+        """
+        self.log_dir = log_dir
+        if log_dir not in _created_dirs:
+            os.makedirs(log_dir, exist_ok=True)
+            _created_dirs.add(log_dir)
+
+        # ANSI escapes are wasted bytes when output is piped to a file
+        use_color = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+        self._console_wrap = self._COLOR_BY_LEVEL if use_color else {}
+
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_file = os.path.join(log_dir, f"run_{run_id}.log")
+        self.error_log_file = os.path.join(log_dir, f"run_{run_id}_errors.log")
+        self.debug_log_file = os.path.join(log_dir, f"run_{run_id}_debug.log")
+
+        # One buffered handle per file for the whole run — re-opening on
+        # every record costs an open/close syscall pair per line, which
+        # dominates at high log rates. 8 KiB buffering amortizes writes.
+        # Writability is proven here once, so the per-record write path
+        # carries no exception guard; if the files cannot be opened the
+        # logger degrades to console-only.
+        try:
+            self._main_fp = open(self.log_file, 'a', buffering=8192, encoding='utf-8')
+            self._err_fp = open(self.error_log_file, 'a', buffering=8192, encoding='utf-8')
+            self._dbg_fp = open(self.debug_log_file, 'a', buffering=8192, encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: Could not open log files, console only: {e}")
+            self._main_fp = self._err_fp = self._dbg_fp = None
+            self._fps_by_level = {}
+            self._default_targets = ()
+        else:
+            # Level → target files, resolved once instead of branching per call
+            self._fps_by_level = {
+                'DEBUG':   [self._main_fp, self._dbg_fp],
+                'INFO':    [self._main_fp],
+                'WARNING': [self._main_fp],
+                'ERROR':   [self._main_fp, self._err_fp],
+            }
+            self._default_targets = (self._main_fp,)
+        atexit.register(self.close)
+
+    def _format_message(self, level: str, message: str) -> str:
+        """Build the timestamped log line"""
+        return f"[{_timestamp()}] [{level}] {message}"
+
+    @staticmethod
+    def _emit(line: bytes) -> None:
+        """Write one console line as a single buffered byte write
+
+        print() costs two stdout writes plus an implicit flush per call
+        on a TTY; assembling the line first keeps it to one.
+        """
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+
+    def _write_to_file(self, fp, message: str) -> None:
+        """Append one line to an open log file"""
+        fp.write(message)
+        fp.write('\n')
+
+    def log(self, level: str, message: str) -> None:
+        """
+        Log a message to console and the appropriate files
+
+        Args:
+            level: Log level name (DEBUG/INFO/WARNING/ERROR)
+            message: Message to log
+        """
+        formatted_message = self._format_message(level, message)
+
+        pre, post = self._console_wrap.get(level, self._PLAIN_WRAP)
+        self._emit(pre + formatted_message.encode('utf-8', 'replace') + post)
+
+        targets = self._fps_by_level.get(level, self._default_targets)
+        for fp in targets:
+            self._write_to_file(fp, formatted_message)
+        if level == 'ERROR':
+            # Errors must survive a crash — push the buffers out now
+            for fp in targets:
+                fp.flush()
+
+    def debug(self, message: str) -> None:
+        self.log('DEBUG', message)
+
+    def info(self, message: str) -> None:
+        self.log('INFO', message)
+
+    def warning(self, message: str) -> None:
+        self.log('WARNING', message)
+
+    def error(self, message: str, exception: Exception = None) -> None:
+        """
+        Log an error, optionally with the active traceback
+
+        Args:
+            message: Error message
+            exception: Exception instance to record
+        """
+        if exception is not None:
+            message = f"{message}: {type(exception).__name__}: {exception}"
+        self.log('ERROR', message)
+        if exception is not None:
+            self.log('DEBUG', f"Traceback:\n{traceback.format_exc()}")
+
+    def log_separator(self, char: str = "=", width: int = 80) -> None:
+        """Log a horizontal separator line"""
+        line = _SEP_CACHE.get((char, width))
+        if line is None:
+            line = char * width
+        self.log('INFO', line)
+
+    def log_sql(self, query: str, max_length: int = 500) -> None:
+        """
+        Log a SQL statement, truncated to keep log lines readable
+
+        Args:
+            query: SQL query text
+            max_length: Maximum characters to keep
+        """
+        text = ' '.join(query.split())
+        if len(text) > max_length:
+            text = text[:max_length] + "..."
+        self.log('DEBUG', f"SQL: {text}")
+
+    def close(self) -> None:
+        """Flush and close all log files"""
+        for fp in (self._main_fp, self._err_fp, self._dbg_fp):
+            if fp is None:
+                continue
+            try:
+                fp.close()
+            except Exception:
+                pass
+
+
+# ── Module-level singleton access ────────────────────────────────────────
+
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def get_logger(log_dir: str = "./Logs") -> Logger:
+    """
+    Get the shared Logger instance, creating it on first use
+
+    Double-checked so concurrent first callers cannot each construct a
+    Logger (duplicate file opens); the initialized path stays lock-free.
+
+    Args:
+        log_dir: Directory for log files
+
+    Returns:
+        Logger: Shared logger instance
+    """
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = Logger(log_dir)
+    return _logger